@@ -0,0 +1,136 @@
+from pathlib import Path
+from urllib.parse import quote
+
+import streamlit as st
+
+
+# ============================
+# CONFIG
+# ============================
+ROOT = Path("static")  # servi en HTTP via enableStaticServing (.streamlit/config.toml)
+CV_PATH = ROOT / "cv" / "CV_Chohdi_Khemakhem.pdf"
+
+CREDITTIC_DIR = ROOT / "creditTic"
+CCI_DIR = ROOT / "cci_cheques_impayes"
+SM_DIR = ROOT / "salle_marche"
+DEVOPS_DIR = ROOT / "devops"
+
+THUMB_SIZE = 480  # px, côté max des miniatures de galerie
+
+CREDITTIC_LINK = ""  # optionnel: lien externe si tu n'as pas de mp4
+
+# ============================
+# HELPERS
+# ============================
+@st.cache_resource(ttl=3600, show_spinner=False)
+def _asset_index() -> frozenset[str]:
+    """Snapshot des chemins (fichiers et dossiers) sous static/."""
+    return frozenset([ROOT.as_posix()] + [p.as_posix() for p in ROOT.rglob("*")])
+
+
+def exists(p: Path) -> bool:
+    return Path(p).as_posix() in _asset_index()
+
+
+def first_existing(*paths: Path) -> Path | None:
+    idx = _asset_index()
+    return next((p for p in paths if p.as_posix() in idx), None)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def collect_images(folder: str, prefixes, exts=("png", "jpg", "jpeg", "webp")) -> list[str]:
+    """
+    Collect images inside 'folder' whose name starts with one of 'prefixes'
+    Example: prefixes=["creditTic_", "cci_", "sm_"]
+    Returns posix paths (cached: the asset folders are static).
+    """
+    folder = Path(folder)
+    if not exists(folder):
+        return []
+    files = []
+    for pref in prefixes:
+        for ext in exts:
+            files.extend(sorted(folder.glob(f"{pref}*.{ext}")))
+    # remove duplicates while keeping order
+    seen, uniq = set(), []
+    for f in files:
+        k = f.as_posix()
+        if k not in seen:
+            uniq.append(k)
+            seen.add(k)
+    return uniq
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def list_devops_images() -> list[str]:
+    exts = ("png", "jpg", "jpeg", "jfif")
+    return sorted(p.as_posix() for ext in exts for p in DEVOPS_DIR.glob(f"devops_*.{ext}"))
+
+
+@st.cache_resource(show_spinner=False)
+def _thumb(path: str) -> str:
+    """
+    Miniature WebP (THUMB_SIZE px max) générée une fois dans <dossier>/_thumbs/.
+    Retourne l'image d'origine si la miniature ne peut pas être écrite.
+    """
+    src = Path(path)
+    out = src.parent / "_thumbs" / f"{src.stem}.webp"
+    if not out.exists() or out.stat().st_mtime < src.stat().st_mtime:
+        try:
+            from PIL import Image
+
+            out.parent.mkdir(exist_ok=True)
+            with Image.open(src) as im:
+                im.thumbnail((THUMB_SIZE, THUMB_SIZE))
+                im.save(out, "webp", quality=82)
+        except (ImportError, OSError):
+            return path
+    return out.as_posix()
+
+
+def render_gallery(images, per_row=3, limit=None):
+    if not images:
+        st.caption("Aucune image détectée.")
+        return
+    if limit is not None:
+        images = images[:limit]
+    # une seule grille HTML (fichiers servis par /app/static) au lieu de N st.image
+    html = (
+        f'<div style="display:grid;grid-template-columns:repeat({per_row},1fr);gap:12px">'
+        + "".join(
+            f'<img src="{static_url(_thumb(str(p)))}" loading="lazy" decoding="async" '
+            'style="width:100%;border-radius:8px"/>'
+            for p in images
+        )
+        + "</div>"
+    )
+    st.markdown(html, unsafe_allow_html=True)
+
+
+@st.cache_data(show_spinner=False)
+def cv_bytes() -> bytes | None:
+    return CV_PATH.read_bytes() if exists(CV_PATH) else None
+
+
+def render_download_cv():
+    data = cv_bytes()
+    if data:
+        st.download_button(
+            "Télécharger le CV",
+            data=data,
+            file_name="CV_Chohdi_Khemakhem.pdf",
+            mime="application/pdf",
+        )
+    else:
+        st.warning("CV manquant : static/cv/CV_Chohdi_Khemakhem.pdf")
+
+
+# ============================
+# IMAGES
+# ============================
+PROFILE_PATH = ROOT / "profile.jpg"  # <-- adapte si ton fichier est .png
+
+
+def static_url(path: str) -> str:
+    """URL servie par Streamlit (cache HTTP navigateur) pour un fichier de static/."""
+    return "app/static/" + quote(Path(path).relative_to(ROOT).as_posix())
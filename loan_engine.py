@@ -2,10 +2,40 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date
-from math import pow
+from functools import lru_cache
 from typing import List, Dict, Tuple
 from typing import Optional
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:  # numba optionnel : les kernels tournent alors en Python pur
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+    prange = range
+    _HAS_NUMBA = False
+
+
+__all__ = [
+    "TYPE_IN_FINE",
+    "TYPE_CONSTANT_AMORTIZATION",
+    "TYPE_ANNUITY",
+    "BASE_MENSUELLE_12",
+    "BASE_360",
+    "ScheduleRow",
+    "Schedule",
+    "build_schedule",
+    "build_schedule_cached",
+    "build_schedule_batch",
+    "compute_taeg",
+    "batch_irr",
+]
+
 
 # ============================
 # TYPES
@@ -21,7 +51,7 @@ BASE_MENSUELLE_12 = "BASE_12"   # r = annual_rate * freq / 12
 BASE_360 = "BASE_360"           # interest = balance * (annual_rate/360) * days
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScheduleRow:
     period: int
     date: date
@@ -31,82 +61,377 @@ class ScheduleRow:
     balance: float
 
 
+@dataclass(frozen=True)
+class Schedule:
+    """
+    Échéancier en colonnes (structure of arrays) : une colonne numpy par champ
+    de ScheduleRow, dates en datetime64[D].
+    """
+    period: np.ndarray
+    date: np.ndarray
+    payment: np.ndarray
+    interest: np.ndarray
+    principal: np.ndarray
+    balance: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.period)
+
+    @classmethod
+    def empty(cls) -> "Schedule":
+        f = np.zeros(0)
+        return cls(np.zeros(0, dtype=np.int64), np.zeros(0, dtype="datetime64[D]"), f, f, f, f)
+
+    def to_rows(self) -> List[ScheduleRow]:
+        """Vue ligne par ligne (compatibilité avec l'ancien List[ScheduleRow])."""
+        return [
+            ScheduleRow(*row)
+            for row in zip(
+                self.period.tolist(), self.date.tolist(), self.payment.tolist(),
+                self.interest.tolist(), self.principal.tolist(), self.balance.tolist(),
+            )
+        ]
+
+
 # ============================
 # DATE HELPERS
 # ============================
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+@lru_cache(maxsize=4096)
 def _add_months(d: date, months: int) -> date:
-    import calendar
     y = d.year + (d.month - 1 + months) // 12
     m = (d.month - 1 + months) % 12 + 1
-    last_day = calendar.monthrange(y, m)[1]
+    # février bissextile : +1 (y % 4 == 0 and (y % 100 != 0 or y % 400 == 0))
+    is_leap = (y & 3 == 0) & ((y % 25 != 0) | (y & 15 == 0))
+    last_day = _DAYS_IN_MONTH[m - 1] + ((m == 2) & is_leap)
     day = min(d.day, last_day)
     return date(y, m, day)
 
 
 def _days_between(d1: date, d2: date) -> int:
-    return (d2 - d1).days
+    # différence d'ordinaux : pas de timedelta intermédiaire
+    return d2.toordinal() - d1.toordinal()
+
+
+def _schedule_dates(first: date, frequency_months: int, n: int) -> List[date]:
+    # chaque date part de l'ancre `first` : pas de dérive fin de mois
+    # (31/01 -> 28/02 -> 31/03) et les appels restent en cache d'un prêt à l'autre
+    return [_add_months(first, frequency_months * k) for k in range(n)]
+
+
+def _period_days(disb: date, dates: List[date]) -> np.ndarray:
+    """Nombre de jours de chaque période (la 1re part du déblocage)."""
+    return np.diff(np.array([disb, *dates], dtype="datetime64[D]")).astype(np.int64)
+
 
-def _npv_rate_with_dates(rate: float, cashflows: List[float], dates: List[date], day_basis: int) -> float:
-    """NPV(rate) with irregular dates: sum(CF_k / (1+rate)^(days_k/basis))."""
+def _schedule(dates, payment, interest, principal, balance) -> Schedule:
+    return Schedule(
+        period=np.arange(1, len(dates) + 1),
+        date=np.array(dates, dtype="datetime64[D]"),
+        payment=payment,
+        interest=interest,
+        principal=principal,
+        balance=balance,
+    )
+
+# plafond du bracket côté haut (ancienne recherche : 5 doublé 12 fois) ;
+# atteint pour les frais énormes sur prêts très courts
+_IRR_HIGH_MAX = 20480.0
+
+
+def _npv_rate_with_dates(rate: float, cashflows: np.ndarray, t: np.ndarray) -> float:
+    """NPV(rate) with irregular dates: sum(CF_k / (1+rate)^t_k), t_k = days_k/basis."""
     if rate <= -0.999999:
         return float("inf")
+    return float(np.sum(cashflows * np.power(1.0 + rate, -t)))
 
-    d0 = dates[0]
-    total = 0.0
-    for cf, dk in zip(cashflows, dates):
-        days = (dk - d0).days
-        t = days / float(day_basis)
-        total += cf / pow(1.0 + rate, t)
-    return total
 
+def _npv_and_deriv(rate: float, cashflows: np.ndarray, t: np.ndarray) -> Tuple[float, float]:
+    """
+    NPV(rate) et dNPV/drate en une seule passe, t_k en fractions d'année :
+    dNPV/drate = sum(-t_k * CF_k / (1+rate)^(t_k+1)).
+    """
+    growth = 1.0 + rate
+    disc = cashflows * np.power(growth, -t)
+    return float(disc.sum()), float(-(t * disc).sum() / growth)
 
-def _irr_bisection_with_dates(
-    cashflows: List[float],
-    dates: List[date],
+
+def _irr_newton_with_dates(
+    cashflows: np.ndarray,
+    days: np.ndarray,
     day_basis: int,
-    low: float = 0.0,
-    high: float = 5.0,
     eps: float = 1e-7,
     max_iter: int = 200,
+    guess: float = 0.1,
+    expand_iter: int = 12,
 ) -> float:
     """
-    Find IRR such that NPV=0 using bisection.
+    Find IRR such that NPV=0: bracket around `guess`, then hybrid
+    Newton/bisection (Newton step while it stays inside the shrinking
+    bracket and converges, bisection step otherwise).
     Returns annual rate (since we use year fractions).
+    days : jours de chaque flux depuis le premier (entiers ; une 1re échéance
+           antérieure au décaissement donne un écart négatif).
     """
-    f_low = _npv_rate_with_dates(low, cashflows, dates, day_basis)
-    f_high = _npv_rate_with_dates(high, cashflows, dates, day_basis)
-
-    # Expand high if needed
+    if _HAS_NUMBA:
+        # appel positionnel : le dispatch numba par mots-clés coûte plus que le calcul
+        return float(_irr_newton_kernel(
+            cashflows, days, float(day_basis), eps, max_iter, guess, expand_iter
+        ))
+
+    t = days / float(day_basis)
+    # résidu d'arrondi toléré sur une VAN nulle (prêt à taux zéro sans frais) :
+    # l'ordre de sommation ne doit pas décider de son signe
+    tol = 1e-12 * float(np.abs(cashflows).sum())
+
+    # bracket adaptatif : ±0.2 autour de l'estimation, élargi (largeur doublée)
+    # du côté où |VAN| est la plus petite, sans descendre sous -0.5 ;
+    # côté haut, croissance géométrique jusqu'à _IRR_HIGH_MAX
+    guess = max(guess, -0.3)
+    low, high = guess - 0.2, guess + 0.2
+    f_low = _npv_rate_with_dates(low, cashflows, t)
+    f_high = _npv_rate_with_dates(high, cashflows, t)
     tries = 0
-    while f_low * f_high > 0 and tries < 12:
-        high *= 2.0
-        f_high = _npv_rate_with_dates(high, cashflows, dates, day_basis)
-        tries += 1
+    while f_low * f_high > 0 and min(abs(f_low), abs(f_high)) > tol:
+        width = high - low
+        if abs(f_low) < abs(f_high) and low > -0.5 and tries < expand_iter:
+            low = max(-0.5, low - width)
+            f_low = _npv_rate_with_dates(low, cashflows, t)
+            tries += 1
+        elif high < _IRR_HIGH_MAX:
+            high = min(max(2.0 * high, high + width), _IRR_HIGH_MAX)
+            f_high = _npv_rate_with_dates(high, cashflows, t)
+        else:
+            break
+
+    if abs(f_low) <= tol:
+        return low
+    if abs(f_high) <= tol:
+        return high
 
     if f_low * f_high > 0:
-        return float("nan")
+        # TAEG très négatif (prêt non remboursé) : balayage de [-0.99, -0.5]
+        high, f_high = -0.5, _npv_rate_with_dates(-0.5, cashflows, t)
+        for low in np.linspace(-0.5, -0.99, 11)[1:]:
+            f_low = _npv_rate_with_dates(low, cashflows, t)
+            if f_low * f_high <= 0:
+                break
+            high, f_high = low, f_low
+        else:
+            return float("nan")
 
-    a, b = low, high
-    fa, fb = f_low, f_high
+    # hybride : chaque évaluation resserre [a, b] ; pas de Newton s'il reste
+    # dans le bracket et au moins divise le pas précédent par deux, sinon bisection
+    a, b, fa = low, high, f_low
+    r = guess if a < guess < b else (a + b) / 2.0
+    step_old = b - a
+    for _ in range(max_iter):
+        f, df = _npv_and_deriv(r, cashflows, t)
+        if abs(f) <= tol:
+            return r
+        if fa * f <= 0:
+            b = r
+        else:
+            a, fa = r, f
+        if df != 0.0 and a < r - f / df < b and abs(2.0 * f) < abs(step_old * df):
+            step = f / df
+        else:
+            step = r - (a + b) / 2.0
+        r -= step
+        step_old = step
+        if abs(step) < eps or b - a < eps:
+            return r
+
+    return r
+
+
+@njit(cache=True)
+def _gap_factors(rate, gaps, day_basis, min_gap, max_gap):
+    """
+    Facteur (1+rate)^-(écart/basis) indexé par écart - min_gap.
+    Les écarts distincts sont peu nombreux (28..31 jours en mensuel) :
+    une exponentielle par écart distinct, pas une par flux.
+    min_gap peut être négatif (1re échéance saisie avant le décaissement) :
+    numba ne vérifie pas les bornes, l'indice doit rester dans la table.
+    """
+    log_growth = np.log(1.0 + rate)
+    table = np.full(max_gap - min_gap + 1, np.nan)
+    for k in range(gaps.shape[0]):
+        idx = gaps[k] - min_gap
+        if np.isnan(table[idx]):
+            table[idx] = np.exp(-(gaps[k] / day_basis) * log_growth)
+    return table
 
+
+@njit(cache=True)
+def _npv_deriv_kernel(rate, cashflows, tcf, gaps, day_basis, min_gap, max_gap):
+    """
+    (VAN, dVAN/drate) en une passe : le facteur d'actualisation avance par
+    produits successifs des facteurs d'écart, tcf = t * cf est précalculé
+    (dVAN/drate = -sum(t * cf * v) / (1 + rate)).
+    """
+    if rate <= -0.999999:
+        return np.inf, 0.0
+    table = _gap_factors(rate, gaps, day_basis, min_gap, max_gap)
+    factor = 1.0
+    f = 0.0
+    d = 0.0
+    for k in range(cashflows.shape[0]):
+        factor *= table[gaps[k] - min_gap]
+        f += cashflows[k] * factor
+        d += tcf[k] * factor
+    return f, -d / (1.0 + rate)
+
+
+@njit(cache=True)
+def _irr_newton_kernel(cashflows, days, day_basis, eps, max_iter, guess, expand_iter):
+    """
+    Version compilée de _irr_newton_with_dates (mêmes étapes) ; écarts et
+    t * cf calculés une fois, puis VAN et dérivée en une passe par taux essayé.
+    """
+    n = days.shape[0]
+    gaps = np.empty(n, dtype=np.int64)
+    tcf = np.empty(n)
+    prev = 0
+    scale = 0.0
+    for k in range(n):
+        gaps[k] = days[k] - prev
+        prev = days[k]
+        tcf[k] = (days[k] / day_basis) * cashflows[k]
+        scale += abs(cashflows[k])
+    min_gap = gaps.min() if n > 0 else 0
+    max_gap = gaps.max() if n > 0 else 0
+    tol = 1e-12 * scale
+
+    guess = max(guess, -0.3)
+    low = guess - 0.2
+    high = guess + 0.2
+    f_low = _npv_deriv_kernel(low, cashflows, tcf, gaps, day_basis, min_gap, max_gap)[0]
+    f_high = _npv_deriv_kernel(high, cashflows, tcf, gaps, day_basis, min_gap, max_gap)[0]
+    tries = 0
+    while f_low * f_high > 0 and min(abs(f_low), abs(f_high)) > tol:
+        width = high - low
+        if abs(f_low) < abs(f_high) and low > -0.5 and tries < expand_iter:
+            low = max(-0.5, low - width)
+            f_low = _npv_deriv_kernel(low, cashflows, tcf, gaps, day_basis, min_gap, max_gap)[0]
+            tries += 1
+        elif high < _IRR_HIGH_MAX:
+            high = min(max(2.0 * high, high + width), _IRR_HIGH_MAX)
+            f_high = _npv_deriv_kernel(high, cashflows, tcf, gaps, day_basis, min_gap, max_gap)[0]
+        else:
+            break
+
+    if abs(f_low) <= tol:
+        return low
+    if abs(f_high) <= tol:
+        return high
+
+    if f_low * f_high > 0:
+        high = -0.5
+        f_high = _npv_deriv_kernel(high, cashflows, tcf, gaps, day_basis, min_gap, max_gap)[0]
+        found = False
+        for k in range(1, 11):
+            low = -0.5 - 0.049 * k
+            f_low = _npv_deriv_kernel(low, cashflows, tcf, gaps, day_basis, min_gap, max_gap)[0]
+            if f_low * f_high <= 0:
+                found = True
+                break
+            high = low
+            f_high = f_low
+        if not found:
+            return np.nan
+
+    a = low
+    b = high
+    fa = f_low
+    r = guess if a < guess < b else (a + b) / 2.0
+    step_old = b - a
     for _ in range(max_iter):
-        c = (a + b) / 2.0
-        fc = _npv_rate_with_dates(c, cashflows, dates, day_basis)
-        if abs(fc) < eps or abs(b - a) < eps:
-            return c
-        if fa * fc <= 0:
-            b, fb = c, fc
+        f, df = _npv_deriv_kernel(r, cashflows, tcf, gaps, day_basis, min_gap, max_gap)
+        if abs(f) <= tol:
+            return r
+        if fa * f <= 0:
+            b = r
+        else:
+            a = r
+            fa = f
+        if df != 0.0 and a < r - f / df < b and abs(2.0 * f) < abs(step_old * df):
+            step = f / df
         else:
-            a, fa = c, fc
+            step = r - (a + b) / 2.0
+        r -= step
+        step_old = step
+        if abs(step) < eps or b - a < eps:
+            return r
+
+    return r
+
+
+def batch_irr(
+    cashflows: np.ndarray,
+    days: np.ndarray,
+    day_basis: int = 365,
+    guess: float | np.ndarray = 0.1,
+) -> np.ndarray:
+    """
+    IRR annuel de S prêts d'un coup (portefeuille).
+
+    cashflows : (S, n) flux signés, une ligne par prêt.
+    days      : (S, n) jours depuis le premier flux (entiers, écarts négatifs admis).
+    Les prêts plus courts se complètent à droite par des flux nuls datés
+    du dernier jour : ils ne changent pas la VAN.
+    guess     : estimation commune ou une par prêt (S,).
+    Retourne un tableau (S,) ; nan quand aucune racine n'est trouvée.
+    """
+    cashflows = np.ascontiguousarray(np.atleast_2d(cashflows), dtype=np.float64)
+    days = np.ascontiguousarray(np.atleast_2d(days), dtype=np.int64)
+    guesses = np.broadcast_to(np.asarray(guess, dtype=np.float64), cashflows.shape[:1]).copy()
+    if _HAS_NUMBA:
+        return _batch_irr_kernel(cashflows, days, float(day_basis), guesses)
+    return np.array([
+        _irr_newton_with_dates(cf, d, day_basis, guess=g)
+        for cf, d, g in zip(cashflows, days, guesses.tolist())
+    ])
+
+
+@njit(cache=True, parallel=True)
+def _batch_irr_kernel(cashflows, days, day_basis, guesses):
+    out = np.empty(cashflows.shape[0])
+    for s in prange(cashflows.shape[0]):
+        out[s] = _irr_newton_kernel(cashflows[s], days[s], day_basis, 1e-7, 200, guesses[s], 12)
+    return out
+
+
+def _level_annuity_rate(pv: float, pmt: float, n: int, eps: float = 1e-12, max_iter: int = 50) -> float:
+    """
+    Taux périodique t tel que pv = pmt * (1 - (1+t)^-n) / t (échéances de niveau).
+    Newton sur la forme fermée : O(1) par itération au lieu d'une VAN en O(n).
+    Retourne nan si pas de taux positif.
+    """
+    if pv <= 0 or pmt <= 0 or n <= 0 or pmt * n <= pv:
+        return float("nan")
 
-    return (a + b) / 2.0
+    t = 2.0 * (pmt * n - pv) / (pv * (n + 1))  # approximation de départ
+    for _ in range(max_iter):
+        v = (1.0 + t) ** -n
+        f = pmt * (1.0 - v) / t - pv
+        df = pmt * (n * v / (1.0 + t) - (1.0 - v) / t) / t
+        step = f / df
+        t -= step
+        if t <= 0.0 or t != t:
+            return float("nan")
+        if abs(step) < eps:
+            return t
+    return t
 
 
 def compute_taeg(
     disbursement_date: date,
     amount: float,
     fee_amount: float,
-    rows: List["ScheduleRow"],
+    rows: Schedule | List[ScheduleRow],
     base: str,
 ) -> float:
     """
@@ -114,25 +439,65 @@ def compute_taeg(
       CF0 = + (amount - fee)
       CFk = - payment at each schedule row date where payment > 0
     day_basis: 365 for BASE_12, 360 for BASE_360 (convention bancaire)
+    rows : Schedule (colonnes lues directement) ou liste de ScheduleRow.
     """
-    if amount <= 0:
-        return float("nan")
-
     day_basis = 360 if base == BASE_360 else 365
+    if isinstance(rows, Schedule):
+        return _compute_taeg_from(disbursement_date, amount, fee_amount, rows.date, rows.payment, day_basis)
+    return _compute_taeg_from(
+        disbursement_date, amount, fee_amount,
+        [r.date for r in rows], [r.payment for r in rows], day_basis,
+    )
 
-    cashflows = [float(amount - fee_amount)]
-    dates = [disbursement_date]
 
-    for r in rows:
-        if r.payment and r.payment > 0:
-            cashflows.append(-float(r.payment))
-            dates.append(r.date)
+def _compute_taeg_from(
+    disbursement_date: date,
+    amount: float,
+    fee_amount: float,
+    row_dates: List[date] | np.ndarray,
+    payments: np.ndarray,
+    day_basis: int,
+    guess: Optional[float] = None,
+) -> float:
+    """
+    compute_taeg sur les colonnes (dates, versements) de l'échéancier.
+    day_basis : 365 ou 360, déjà résolu par l'appelant.
+    guess : point de départ du Newton (TAEG annuel estimé) ; par défaut,
+    taux simple (versements / montant net - 1) / durée moyenne pondérée.
+    """
+    if amount <= 0:
+        return float("nan")
 
+    payments = np.asarray(payments, dtype=float)
+    paid = payments > 0
     # Need at least one outflow
-    if len(cashflows) < 2:
+    if not paid.any():
         return float("nan")
 
-    return _irr_bisection_with_dates(cashflows, dates, day_basis=day_basis)
+    # flux et jours depuis le déblocage calculés une fois, en tableaux, avant l'IRR
+    cashflows = np.concatenate(([float(amount - fee_amount)], -payments[paid]))
+    days = np.array(row_dates, dtype="datetime64[D]")[paid] - np.datetime64(disbursement_date, "D")
+    days = np.concatenate(([0], days.astype(np.int64)))
+
+    if guess is None:
+        outflows = payments[paid]
+        t_mean = float((days[1:] * outflows).sum() / outflows.sum()) / day_basis
+        guess = 0.1
+        if cashflows[0] > 0 and t_mean > 0:
+            guess = (float(outflows.sum()) / cashflows[0] - 1.0) / t_mean
+
+    # flux arrondis à 1e-4 : mêmes versements => même clé de cache
+    return _irr_cached(
+        tuple(np.round(cashflows, 4).tolist()), tuple(days.tolist()), day_basis, float(guess)
+    )
+
+
+@lru_cache(maxsize=512)
+def _irr_cached(cashflows: Tuple[float, ...], days: Tuple[int, ...], day_basis: int, guess: float) -> float:
+    """_irr_newton_with_dates mémoïsé sur la signature des flux (tuples hashables)."""
+    return _irr_newton_with_dates(
+        np.array(cashflows), np.array(days, dtype=np.int64), day_basis, guess=guess
+    )
 
 # ============================
 # RATES + INTEREST
@@ -155,11 +520,13 @@ def _interest_amount(
     prev_date: date | None,
     disbursement_date: date,
     frequency_months: int,
+    days: int | None = None,
 ) -> float:
     """
     Intérêt par période :
     - BASE_12 : I = balance * r_period
     - BASE_360 : I = balance * (annual_rate/360) * nb_jours
+    `days` (nb de jours déjà connu de l'appelant) évite de recalculer les dates.
     """
     if balance <= 0:
         return 0.0
@@ -170,15 +537,27 @@ def _interest_amount(
 
     # BASE_360
     daily = annual_rate / 360.0
-    if period_index == 1:
-        days = _days_between(disbursement_date, current_date)
-    else:
-        if prev_date is None:
-            prev_date = _add_months(current_date, -frequency_months)
-        days = _days_between(prev_date, current_date)
+    if days is None:
+        if period_index == 1:
+            days = _days_between(disbursement_date, current_date)
+        else:
+            if prev_date is None:
+                prev_date = _add_months(current_date, -frequency_months)
+            days = _days_between(prev_date, current_date)
     return balance * daily * max(days, 0)
 
 
+def _period_rates(annual_rate, base_is_12: bool, frequency_months: int, days: np.ndarray) -> np.ndarray:
+    """
+    Taux de chaque période d'intérêt, base résolue une fois pour toutes :
+    les kernels n'ont plus qu'à faire interest = balance * rate[k].
+    annual_rate peut être un tableau (S, 1) : résultat en (S, n).
+    """
+    if base_is_12:
+        return annual_rate * frequency_months / 12.0 * np.ones(days.shape)
+    return (annual_rate / 360.0) * np.maximum(days, 0)
+
+
 # ============================
 # CORE API
 # ============================
@@ -196,9 +575,11 @@ def build_schedule(
     deferred_periods: int = 0,
     flat: bool = False,
     fee_amount: float = 0.0,
-) -> Tuple[List[ScheduleRow], Dict[str, float]]:
+) -> Tuple[Schedule, Dict[str, float]]:
     """
-    Retourne (rows, summary)
+    Retourne (schedule, summary)
+
+    schedule : Schedule en colonnes numpy (schedule.to_rows() pour des ScheduleRow)
 
     - repayment_type : IN_FINE / CONSTANT_AMORTIZATION / ANNUITY
     - payment_frequency_months : fréquence des paiements
@@ -210,32 +591,95 @@ def build_schedule(
 
     # validations simples
     if amount <= 0 or annual_rate < 0 or period_count <= 0:
-        return [], {}
+        return Schedule.empty(), {}
     if payment_frequency_months <= 0 or interest_frequency_months <= 0:
-        return [], {}
+        return Schedule.empty(), {}
+
+    # base résolue une fois ici : les modes ne comparent plus de chaînes
+    base_is_12 = base == BASE_MENSUELLE_12
+    day_basis = 360 if base == BASE_360 else 365
 
     if repayment_type == TYPE_IN_FINE:
         return _schedule_in_fine(
             amount, annual_rate, period_count,
             payment_frequency_months, interest_frequency_months,
-            deferred_periods, base, disbursement_date, first_installment_date, fee_amount
+            deferred_periods, base_is_12, day_basis, disbursement_date, first_installment_date, fee_amount
         )
 
     if repayment_type == TYPE_CONSTANT_AMORTIZATION:
         return _schedule_constant_amortization(
             amount, annual_rate, period_count,
             payment_frequency_months, interest_frequency_months,
-            deferred_periods, base, disbursement_date, first_installment_date, fee_amount
+            deferred_periods, base_is_12, day_basis, disbursement_date, first_installment_date, fee_amount
         )
 
     if repayment_type == TYPE_ANNUITY:
         return _schedule_annuity(
             amount, annual_rate, period_count,
             payment_frequency_months, interest_frequency_months,
-            deferred_periods, flat, base, disbursement_date, first_installment_date, fee_amount
+            deferred_periods, flat, base_is_12, day_basis, disbursement_date, first_installment_date, fee_amount
         )
 
-    return [], {}
+    return Schedule.empty(), {}
+
+
+@lru_cache(maxsize=256)
+def _build_cached(*args, **kwargs) -> Tuple[Schedule, Dict[str, float]]:
+    schedule, summary = build_schedule(*args, **kwargs)
+    # colonnes partagées entre appels : lecture seule
+    for col in (schedule.period, schedule.date, schedule.payment,
+                schedule.interest, schedule.principal, schedule.balance):
+        col.setflags(write=False)
+    return schedule, summary
+
+
+def build_schedule_cached(*args, **kwargs) -> Tuple[Schedule, Dict[str, float]]:
+    """
+    build_schedule mémoïsé (entrées scalaires/dates hashables, calcul pur).
+    Les colonnes du Schedule sont en lecture seule et le summary retourné est
+    une copie : le résultat en cache n'est pas modifiable.
+    """
+    schedule, summary = _build_cached(*args, **kwargs)
+    return schedule, dict(summary)
+
+
+# ============================
+# SCAFFOLDING COMMUN AUX MODES
+# ============================
+def _grid(
+    period_count: int, payment_freq_m: int, interest_freq_m: int, deferred_periods: int,
+) -> Tuple[int, int, int]:
+    """
+    (n_interest, payment_step, n_payments) :
+    périodes d'intérêt, périodes d'intérêt par paiement, paiements après différé.
+    """
+    n_interest = max(1, period_count // interest_freq_m)
+    payment_step = max(1, payment_freq_m // interest_freq_m)
+    n_payments = max(1, (period_count // payment_freq_m) - max(0, deferred_periods // payment_step))
+    return n_interest, payment_step, n_payments
+
+
+def _finish(
+    dates: List[date],
+    cols: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    amount: float,
+    fee_amount: float,
+    disb: date,
+    day_basis: int,
+    guess: Optional[float] = None,
+    **extra: float,
+) -> Tuple[Schedule, Dict[str, float]]:
+    """Schedule + summary (totaux, champs propres au mode, TAEG) à partir des colonnes."""
+    payment, interest, principal, balance = cols
+    summary = {
+        "total_payment": float(payment.sum()),
+        "total_interest": float(interest.sum()),
+        "total_principal": float(principal.sum()),
+        "fee_amount": fee_amount,
+        **extra,
+    }
+    summary["taeg"] = _compute_taeg_from(disb, amount, fee_amount, dates, payment, day_basis, guess)
+    return _schedule(dates, payment, interest, principal, balance), summary
 
 
 # ============================
@@ -248,11 +692,12 @@ def _schedule_in_fine(
     payment_freq_m: int,
     interest_freq_m: int,
     deferred_periods: int,
-    base: str,
+    base_is_12: bool,
+    day_basis: int,
     disb: date,
     first: date,
     fee_amount: float,
-) -> Tuple[List[ScheduleRow], Dict[str, float]]:
+) -> Tuple[Schedule, Dict[str, float]]:
     """
     In fine :
     - intérêts à chaque échéance d'intérêt
@@ -260,69 +705,23 @@ def _schedule_in_fine(
     - principal payé à la dernière échéance de paiement
     - différé : pendant deferred_periods (périodes d’intérêt), aucun paiement
     """
-    rows: List[ScheduleRow] = []
-    balance = amount
-
-    # nombre de périodes d'intérêt
-    n_interest = max(1, period_count // interest_freq_m)
-    payment_step = max(1, payment_freq_m // interest_freq_m)
-
-    current = first
-    prev_date = None
-
-    total_payment = total_interest = total_principal = 0.0
-
-    for i in range(1, n_interest + 1):
-        # différé : pas de paiement / pas de principal
-        if i <= deferred_periods:
-            interest = 0.0
-            payment = 0.0
-            principal = 0.0
-        else:
-            interest = _interest_amount(
-                balance=balance,
-                annual_rate=annual_rate,
-                base=base,
-                period_index=i,
-                current_date=current,
-                prev_date=prev_date,
-                disbursement_date=disb,
-                frequency_months=interest_freq_m,
-            )
-
-            is_payment_event = (i % payment_step == 0)
+    n_interest, payment_step, _ = _grid(period_count, payment_freq_m, interest_freq_m, deferred_periods)
+    dates = _schedule_dates(first, interest_freq_m, n_interest)
 
-            # Paiement uniquement à chaque event de paiement
-            if is_payment_event:
-                # principal uniquement au dernier paiement
-                if i == n_interest:
-                    principal = balance
-                else:
-                    principal = 0.0
-                payment = interest + principal
-            else:
-                # ligne d’intérêt (sans paiement)
-                payment = interest
-                principal = 0.0
+    # le capital reste entier jusqu'à la dernière ligne : une seule passe numpy
+    idx = np.arange(1, n_interest + 1)
+    active = idx > deferred_periods  # différé : pas de paiement / pas de principal
+    rate = _period_rates(annual_rate, base_is_12, interest_freq_m, _period_days(disb, dates))
+    interest = np.where(active, amount * rate, 0.0)
 
-        balance = max(0.0, balance - principal)
-
-        rows.append(ScheduleRow(i, current, payment, interest, principal, balance))
-        total_payment += payment
-        total_interest += interest
-        total_principal += principal
-
-        prev_date = current
-        current = _add_months(current, interest_freq_m)
-
-    summary = {
-        "total_payment": total_payment,
-        "total_interest": total_interest,
-        "total_principal": total_principal,
-        "fee_amount": fee_amount,
-    }
-    summary["taeg"] = compute_taeg(disb, amount, fee_amount, rows, base)
-    return rows, summary
+    # principal uniquement au dernier paiement
+    principal = np.zeros(n_interest)
+    if active[-1] and n_interest % payment_step == 0:
+        principal[-1] = amount
+    payment = interest + principal
+    balance = np.full(n_interest, amount)
+    balance[-1] -= principal[-1]
+    return _finish(dates, (payment, interest, principal, balance), amount, fee_amount, disb, day_basis)
 
 
 # ============================
@@ -335,92 +734,67 @@ def _schedule_constant_amortization(
     payment_freq_m: int,
     interest_freq_m: int,
     deferred_periods: int,
-    base: str,
+    base_is_12: bool,
+    day_basis: int,
     disb: date,
     first: date,
     fee_amount: float,
-) -> Tuple[List[ScheduleRow], Dict[str, float]]:
+) -> Tuple[Schedule, Dict[str, float]]:
     """
     Amortissement constant :
     - principal constant payé uniquement aux dates de paiement
     - intérêts calculés à la fréquence interest_freq_m
     - si paiement moins fréquent que les intérêts, on capitalise l’intérêt dans les paiements (carry)
     """
-    rows: List[ScheduleRow] = []
-    balance = amount
-
-    n_interest = max(1, period_count // interest_freq_m)
-    payment_step = max(1, payment_freq_m // interest_freq_m)
-
-    # nombre d’évènements de paiement après différé
-    n_payments = max(1, (period_count // payment_freq_m) - max(0, deferred_periods // payment_step))
+    n_interest, payment_step, n_payments = _grid(period_count, payment_freq_m, interest_freq_m, deferred_periods)
     amort_per_payment = amount / n_payments
 
-    current = first
-    prev_date = None
-
-    carry_interest = 0.0
-    total_payment = total_interest = total_principal = 0.0
-
-    payment_event_count = 0
-
-    for i in range(1, n_interest + 1):
-        if i <= deferred_periods:
-            interest = 0.0
-            payment = 0.0
-            principal = 0.0
-        else:
-            interest = _interest_amount(
-                balance=balance,
-                annual_rate=annual_rate,
-                base=base,
-                period_index=i,
-                current_date=current,
-                prev_date=prev_date,
-                disbursement_date=disb,
-                frequency_months=interest_freq_m,
-            )
+    dates = _schedule_dates(first, interest_freq_m, n_interest)
+    rate = _period_rates(annual_rate, base_is_12, interest_freq_m, _period_days(disb, dates))
+    cols = _constant_amortization_arrays(
+        amount, rate, payment_step, deferred_periods, n_payments, amort_per_payment,
+    )
+    return _finish(dates, cols, amount, fee_amount, disb, day_basis)
 
-            is_payment_event = (i % payment_step == 0)
 
-            if is_payment_event:
-                payment_event_count += 1
-
-                # paiement = amortissement + intérêts accumulés
-                interest_total = interest + carry_interest
-                carry_interest = 0.0
-
-                principal = amort_per_payment
-                # dernier paiement : on ferme le solde
-                if payment_event_count == n_payments:
-                    principal = balance
-
-                payment = principal + interest_total
-
-            else:
-                # pas de paiement => on accumule les intérêts
-                carry_interest += interest
-                payment = 0.0
-                principal = 0.0
-
-        balance = max(0.0, balance - principal)
-
-        rows.append(ScheduleRow(i, current, payment, interest, principal, balance))
-        total_payment += payment
-        total_interest += interest
-        total_principal += principal
-
-        prev_date = current
-        current = _add_months(current, interest_freq_m)
+def _constant_amortization_arrays(
+    amount, rate, payment_step, deferred_periods, n_payments, amort_per_payment,
+):
+    """
+    Colonnes payment/interest/principal/balance par masques.
 
-    summary = {
-        "total_payment": total_payment,
-        "total_interest": total_interest,
-        "total_principal": total_principal,
-        "fee_amount": fee_amount,
-    }
-    summary["taeg"] = compute_taeg(disb, amount, fee_amount, rows, base)
-    return rows, summary
+    Le principal ne dépend pas du taux : le solde se déduit d'un cumul,
+    les intérêts en découlent. `rate` est (n,) ou (S, n) ; les masques
+    portent sur le dernier axe.
+    """
+    n_interest = rate.shape[-1]
+    i = np.arange(1, n_interest + 1)
+    active = i > deferred_periods
+    payment_mask = active & (i % payment_step == 0)
+    payment_event = np.cumsum(payment_mask)
+
+    principal_row = np.where(payment_mask, amort_per_payment, 0.0)
+    # dernier paiement : on ferme le solde restant
+    closing = np.flatnonzero(payment_mask & (payment_event == n_payments))
+    if closing.size:
+        k = closing[0]
+        principal_row[k] = amount - principal_row[:k].sum()
+
+    # la garde n'absorbe que les échéances surnuméraires (fréquences non multiples)
+    balance_row = np.maximum(amount - np.cumsum(principal_row), 0.0)
+    balance_open = np.concatenate(([amount], balance_row[:-1]))
+    interest = np.where(active, balance_open * rate, 0.0)
+
+    # intérêts accumulés entre deux paiements (carry), versés au paiement
+    accrued = np.cumsum(interest, axis=-1)[..., payment_mask]
+    interest_due = np.diff(accrued, axis=-1, prepend=0.0)
+    payment = np.zeros_like(interest)
+    payment[..., payment_mask] = principal_row[payment_mask] + interest_due
+
+    shape = interest.shape
+    principal = np.broadcast_to(principal_row, shape).copy()
+    balance = np.broadcast_to(balance_row, shape).copy()
+    return payment, interest, principal, balance
 
 
 # ============================
@@ -431,7 +805,8 @@ def _annuity_payment(P: float, r: float, n: int) -> float:
         return 0.0
     if abs(r) < 1e-12:
         return P / n
-    return (P * r) / (1 - pow(1 + r, -n))
+    c = (1 + r) ** n
+    return P * r * c / (c - 1)
 
 
 def _schedule_annuity(
@@ -442,11 +817,12 @@ def _schedule_annuity(
     interest_freq_m: int,
     deferred_periods: int,
     flat: bool,
-    base: str,
+    base_is_12: bool,
+    day_basis: int,
     disb: date,
     first: date,
     fee_amount: float,
-) -> Tuple[List[ScheduleRow], Dict[str, float]]:
+) -> Tuple[Schedule, Dict[str, float]]:
     """
     Annuité constante :
     - on calcule une échéance constante aux dates de paiement
@@ -454,101 +830,225 @@ def _schedule_annuity(
     - si flat=True : intérêts basés sur capital initial (P0), sinon sur solde restant
     - si paiement moins fréquent que les intérêts : intérêts s'accumulent (carry)
     """
-    rows: List[ScheduleRow] = []
-    balance = amount
-
-    n_interest = max(1, period_count // interest_freq_m)
-    payment_step = max(1, payment_freq_m // interest_freq_m)
-
-    n_payments = max(1, (period_count // payment_freq_m) - max(0, deferred_periods // payment_step))
+    n_interest, payment_step, n_payments = _grid(period_count, payment_freq_m, interest_freq_m, deferred_periods)
 
     # taux par période de paiement (pour calculer l'annuité)
-    if base == BASE_MENSUELLE_12:
+    if base_is_12:
         r_pay = _rate_base12(annual_rate, payment_freq_m)
     else:
         r_pay = _rate_equiv_360(annual_rate, payment_freq_m)
 
     payment_const = _annuity_payment(amount, r_pay, n_payments)
 
-    current = first
-    prev_date = None
+    dates = _schedule_dates(first, interest_freq_m, n_interest)
+    if (
+        base_is_12 and not flat
+        and payment_freq_m == interest_freq_m and deferred_periods < n_interest
+    ):
+        # cas courant (ni carry, ni flat) : forme fermée, différé compris
+        cols = _annuity_closed_form(amount, r_pay, n_payments, payment_const, max(0, deferred_periods))
+    else:
+        rate = _period_rates(annual_rate, base_is_12, interest_freq_m, _period_days(disb, dates))
+        cols = _annuity_kernel(
+            amount, rate, n_interest, payment_step, deferred_periods, n_payments, payment_const, flat,
+        )
 
+    # échéances de niveau : taux de l'annuité en forme fermée, annualisé,
+    # comme point de départ du TAEG (les dates réelles restent irrégulières)
+    guess = None
+    if payment_freq_m == interest_freq_m and deferred_periods <= 0:
+        # sans frais, payment_const a été calculé à partir de r_pay : c'est le taux
+        t = r_pay if fee_amount == 0 else _level_annuity_rate(amount - fee_amount, payment_const, n_payments)
+        if t == t and t > 0:
+            guess = (1.0 + t) ** (12.0 / payment_freq_m) - 1.0
+    return _finish(
+        dates, cols, amount, fee_amount, disb, day_basis, guess,
+        payment_const=payment_const,
+        flat=float(flat),
+        interest_frequency_months=float(interest_freq_m),
+        payment_frequency_months=float(payment_freq_m),
+        deferred_periods=float(deferred_periods),
+    )
+
+
+def _annuity_closed_form(amount: float, r, n: int, payment_const, deferred: int = 0):
+    """
+    Annuité à taux périodique fixe, une échéance par période :
+    B_k = P(1+r)^k - A((1+r)^k - 1)/r, I_k = B_{k-1} r, principal_k = A - I_k.
+    La dernière échéance ferme le solde.
+    deferred : lignes de différé en tête (ni intérêt ni paiement, solde = P).
+    r et payment_const peuvent être des tableaux (S,) : résultats en (S, deferred + n).
+    """
+    k = np.arange(n + 1)
+    r = np.asarray(r, dtype=float)[..., None]
+    a = np.asarray(payment_const, dtype=float)[..., None]
+    growth = (1.0 + r) ** k
+    zero = np.abs(r) < 1e-12
+    with np.errstate(divide="ignore", invalid="ignore"):
+        repaid = np.where(zero, a * k, a * (growth - 1.0) / np.where(zero, 1.0, r))
+    balance = amount * growth - repaid
+    interest = balance[..., :-1] * r
+    principal = a - interest
+    payment = np.broadcast_to(a, interest.shape).copy()
+    principal[..., -1] = balance[..., -2]
+    payment[..., -1] = balance[..., -2] + interest[..., -1]
+    balance = np.maximum(balance[..., 1:], 0.0)
+    balance[..., -1] = 0.0
+    if deferred > 0:
+        lead = np.zeros(interest.shape[:-1] + (deferred,))
+        payment, interest, principal = (
+            np.concatenate((lead, col), axis=-1) for col in (payment, interest, principal)
+        )
+        balance = np.concatenate((lead + amount, balance), axis=-1)
+    return payment, interest, principal, balance
+
+
+@njit(cache=True)
+def _annuity_kernel(
+    amount, rate, n_interest, payment_step, deferred_periods, n_payments, payment_const, flat,
+):
+    payment = np.zeros(n_interest)
+    interest = np.zeros(n_interest)
+    principal = np.zeros(n_interest)
+    balance_out = np.empty(n_interest)
+    balance = amount
     carry_interest = 0.0
-    total_payment = total_interest = total_principal = 0.0
     payment_event_count = 0
 
     for i in range(1, n_interest + 1):
-        if i <= deferred_periods:
-            interest = 0.0
-            payment = 0.0
-            principal = 0.0
-        else:
+        k = i - 1
+        if i > deferred_periods:
             # intérêt calculé sur solde ou capital initial (flat)
             base_balance_for_interest = amount if flat else balance
+            interest[k] = base_balance_for_interest * rate[k]
 
-            interest = _interest_amount(
-                balance=base_balance_for_interest,
-                annual_rate=annual_rate,
-                base=base,
-                period_index=i,
-                current_date=current,
-                prev_date=prev_date,
-                disbursement_date=disb,
-                frequency_months=interest_freq_m,
-            )
-
-            is_payment_event = (i % payment_step == 0)
-
-            if is_payment_event:
+            if i % payment_step == 0:
                 payment_event_count += 1
 
-                interest_total = interest + carry_interest
+                interest_total = interest[k] + carry_interest
                 carry_interest = 0.0
 
-                payment = payment_const
+                payment[k] = payment_const
 
                 # si annuité < intérêts -> principal nul, carry
-                if payment < interest_total:
-                    carry_interest = interest_total - payment
-                    principal = 0.0
+                if payment_const < interest_total:
+                    carry_interest = interest_total - payment_const
                 else:
-                    principal = payment - interest_total
+                    principal[k] = payment_const - interest_total
 
                 # dernier paiement : fermeture
                 if payment_event_count == n_payments:
-                    payment = balance + interest_total
-                    principal = balance
-
+                    payment[k] = balance + interest_total
+                    principal[k] = balance
             else:
                 # pas de paiement => on accumule intérêts
-                carry_interest += interest
-                payment = 0.0
-                principal = 0.0
+                carry_interest += interest[k]
 
-        balance = max(0.0, balance - principal)
+        # la dernière échéance ferme déjà le solde (principal = balance) :
+        # la garde n'absorbe que la dérive flottante et les échéances
+        # surnuméraires (fréquences non multiples)
+        balance -= principal[k]
+        if balance < 0.0:
+            balance = 0.0
+        balance_out[k] = balance
 
-        rows.append(ScheduleRow(i, current, payment, interest, principal, balance))
-        total_payment += payment
-        total_interest += interest
-        total_principal += principal
+    return payment, interest, principal, balance_out
 
-        prev_date = current
-        current = _add_months(current, interest_freq_m)
 
-    summary = {
-        "total_payment": total_payment,
-        "total_interest": total_interest,
-        "total_principal": total_principal,
-        "payment_const": payment_const,
-        "flat": float(flat),
-        "fee_amount": fee_amount,
-        "interest_frequency_months": float(interest_freq_m),
-        "payment_frequency_months": float(payment_freq_m),
-        "deferred_periods": float_toggle(deferred_periods),
-    }
-    summary["taeg"] = compute_taeg(disb, amount, fee_amount, rows, base)
-    return rows, summary
+# ============================
+# BATCH — SCENARIOS DE TAUX
+# ============================
+def build_schedule_batch(
+    repayment_type: str,
+    amount: float,
+    annual_rates: np.ndarray,
+    period_count: int,
+    payment_frequency_months: int,
+    base: str,
+    disbursement_date: date,
+    first_installment_date: date,
+    interest_frequency_months: int = 1,
+    deferred_periods: int = 0,
+    flat: bool = False,
+) -> Schedule:
+    """
+    Même échéancier que build_schedule, recalculé pour S taux annuels.
+
+    Retourne un Schedule dont period/date sont communs (n,) et dont
+    payment/interest/principal/balance sont en (S, n), une ligne par taux.
+    Pas de summary : les totaux s'obtiennent par .sum(axis=1).
+    """
+    rates = np.atleast_1d(np.asarray(annual_rates, dtype=float))
+    if amount <= 0 or period_count <= 0 or rates.size == 0 or (rates < 0).any():
+        return Schedule.empty()
+    if payment_frequency_months <= 0 or interest_frequency_months <= 0:
+        return Schedule.empty()
+
+    n_interest, payment_step, n_payments = _grid(
+        period_count, payment_frequency_months, interest_frequency_months, deferred_periods
+    )
+    base_is_12 = base == BASE_MENSUELLE_12
 
+    dates = _schedule_dates(first_installment_date, interest_frequency_months, n_interest)
+    # une ligne de taux périodiques par scénario : (S, n)
+    rate = _period_rates(
+        rates[:, None], base_is_12, interest_frequency_months, _period_days(disbursement_date, dates)
+    )
 
-def float_toggle(x: int) -> float:
-    return float(x)
+    if repayment_type == TYPE_IN_FINE:
+        cols = _in_fine_batch(amount, rate, payment_step, deferred_periods)
+    elif repayment_type == TYPE_CONSTANT_AMORTIZATION:
+        cols = _constant_amortization_arrays(
+            amount, rate, payment_step, deferred_periods, n_payments, amount / n_payments,
+        )
+    elif repayment_type == TYPE_ANNUITY:
+        if base_is_12:
+            r_pay = _rate_base12(rates, payment_frequency_months)
+        else:
+            r_pay = _rate_equiv_360(rates, payment_frequency_months)
+        payment_const = np.array([_annuity_payment(amount, r, n_payments) for r in r_pay.tolist()])
+        if (
+            base_is_12 and not flat
+            and payment_frequency_months == interest_frequency_months and deferred_periods < n_interest
+        ):
+            cols = _annuity_closed_form(amount, r_pay, n_payments, payment_const, max(0, deferred_periods))
+        else:
+            cols = _annuity_batch(
+                amount, rate, n_interest, payment_step, deferred_periods, n_payments, payment_const, flat,
+            )
+    else:
+        return Schedule.empty()
+
+    return _schedule(dates, *cols)
+
+
+def _in_fine_batch(amount, rate, payment_step, deferred_periods):
+    n_interest = rate.shape[1]
+    active = np.arange(1, n_interest + 1) > deferred_periods
+    interest = np.where(active, amount * rate, 0.0)
+    principal = np.zeros_like(interest)
+    if active[-1] and n_interest % payment_step == 0:
+        principal[:, -1] = amount
+    balance = np.full_like(interest, amount)
+    balance[:, -1] -= principal[:, -1]
+    return interest + principal, interest, principal, balance
+
+
+@njit(cache=True, parallel=True)
+def _annuity_batch(
+    amount, rate, n_interest, payment_step, deferred_periods, n_payments, payment_const, flat,
+):
+    n_scen = rate.shape[0]
+    payment = np.empty((n_scen, n_interest))
+    interest = np.empty((n_scen, n_interest))
+    principal = np.empty((n_scen, n_interest))
+    balance = np.empty((n_scen, n_interest))
+    for s in prange(n_scen):
+        p, i, c, b = _annuity_kernel(
+            amount, rate[s], n_interest, payment_step, deferred_periods, n_payments, payment_const[s], flat,
+        )
+        payment[s] = p
+        interest[s] = i
+        principal[s] = c
+        balance[s] = b
+    return payment, interest, principal, balance
@@ -0,0 +1,189 @@
+import streamlit as st
+
+
+# ============================
+# ACCUEIL
+# ============================
+@st.fragment
+def accueil_page():
+    st.markdown("""
+<style>
+.hero {
+    background: white;
+    padding: 3rem;
+    border-radius: 20px;
+    border: 1px solid #e5e7eb;
+    box-shadow: 0 10px 30px rgba(0,0,0,0.06);
+}
+
+.hero-name {
+    font-size: 44px;
+    font-weight: 800;
+    color: #0f172a;
+    margin-bottom: 0.4rem;
+}
+
+.hero-subtitle {
+    font-size: 18px;
+    color: #334155;
+    margin-bottom: 1.2rem;
+}
+
+.hero-desc {
+    font-size: 16px;
+    color: #475569;
+    max-width: 720px;
+    line-height: 1.6;
+}
+
+.badges span {
+    display: inline-block;
+    background: #f1f5f9;
+    color: #0f172a;
+    padding: 6px 14px;
+    border-radius: 999px;
+    font-size: 13px;
+    margin-right: 8px;
+    margin-bottom: 14px;
+    border: 1px solid #e2e8f0;
+}
+</style>
+""", unsafe_allow_html=True)
+
+
+
+    st.markdown("""
+<div class="hero">
+
+  <div class="badges">
+    <span>FinTech</span>
+    <span>Applications Bancaires</span>
+    <span>Risque & Garanties</span>
+  </div>
+
+  <div class="hero-name">Chohdi Khemakhem</div>
+
+  <div class="hero-subtitle">
+    Ingénieur en Informatique Financière —
+    Java / Spring Boot • Angular • Python • KPIs & Tableaux de bord
+  </div>
+
+  <div class="hero-desc">
+    Je conçois des applications bancaires sécurisées et orientées métier
+    (crédit, gestion des garanties, suivi post-attribution),
+    avec une approche centrée produit, risque et performance opérationnelle.
+  </div>
+
+</div>
+""", unsafe_allow_html=True)
+
+
+
+
+
+    st.write("")
+    st.markdown("<hr style='opacity:0.05'/>", unsafe_allow_html=True)
+
+
+    # Metrics
+    st.markdown(
+        """
+    <style>
+    /* Force smaller metrics (Streamlit) */
+    div[data-testid="stMetric"] * { 
+    font-size: inherit !important;
+    }
+
+    div[data-testid="stMetric"] {
+    padding: 10px 10px !important;
+    }
+
+    div[data-testid="stMetricLabel"] {
+    font-size: 12px !important;
+    opacity: 0.75 !important;
+    margin-bottom: 4px !important;
+    }
+
+    div[data-testid="stMetricValue"] {
+    font-size: 18px !important;
+    font-weight: 650 !important;
+    line-height: 1.15 !important;
+    white-space: nowrap !important;
+    overflow: hidden !important;
+    text-overflow: ellipsis !important;
+    }
+
+    /* Sometimes Streamlit wraps the value in p/span */
+    div[data-testid="stMetricValue"] p,
+    div[data-testid="stMetricValue"] span {
+    font-size: 18px !important;
+    font-weight: 650 !important;
+    }
+    </style>
+    """,
+        unsafe_allow_html=True,
+    )
+
+
+    c1, c2, c3, c4 = st.columns(4)
+
+    with c1:
+        st.metric("Focus", "Crédit & Garanties")
+
+    with c2:
+        st.metric("Stack", "Spring Boot / Angular")
+
+    with c3:
+        st.metric("Data", "KPIs & Dashboards")
+
+    with c4:
+        st.metric("Sécurité", "SSO / MFA")
+
+    st.write("")
+    st.markdown("<hr/>", unsafe_allow_html=True)
+
+    # Main content
+    left, right = st.columns([1.2, 0.8], gap="large")
+
+   
+    with left:
+        st.subheader("🎯Résumé")
+        st.markdown(
+            """
+    **Ingénieur FinTech** avec une expérience pratique sur des **plateformes bancaires**, 
+    incluant la **digitalisation du cycle de crédit**, les **calculs financiers** 
+    (**LTV**, **DTI**, **annuités**), la **gestion des garanties / collatéraux**, 
+    les **dashboards décisionnels**, la **génération de documents** et les **aspects de sécurité**.
+            """
+        )
+
+        st.subheader("✅Contenu du portfolio")
+        st.markdown(
+            """
+    - **Projets bancaires** : **CréditTic**, **Centrale des Chèques Impayés**, **Salle de Marché**  
+      *(captures d’écran et démonstrations fonctionnelles)*
+
+    - **Démo technique** : **moteur d’échéancier de crédit**  
+      *(plusieurs modes de remboursement, calculs détaillés, export des résultats)*
+
+    - **Synthèse des compétences** : **développement applicatif**, **sécurité**,  
+      **KPIs & dashboards**, **logique métier bancaire**
+            """
+        )
+
+
+    with right:
+        st.subheader("📍 Infos")
+        st.markdown(
+            """
+            <div class="card">
+                <b>Localisation :</b> Tunis, Tunisie<br/>
+                <b>Email :</b> chohdi.kema@gmail.com<br/>
+                <b>Tél :</b> +216 50 513 004<br/>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+
+
+accueil_page()
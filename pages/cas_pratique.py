@@ -0,0 +1,215 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from loan_engine import (
+    build_schedule_cached,
+    TYPE_IN_FINE,
+    TYPE_CONSTANT_AMORTIZATION,
+    TYPE_ANNUITY,
+    BASE_360,
+    BASE_MENSUELLE_12,
+)
+
+
+# ============================
+# DEMONSTRATION (loan_engine.py)
+# ============================
+PREVIEW_ROWS = 24
+
+
+@st.cache_data(show_spinner=False)
+def compute_schedule(**params) -> tuple[pd.DataFrame | None, dict, bytes]:
+    """
+    (df_preview, summary, csv_bytes) mis en cache par jeu de paramètres du prêt :
+    l'échéancier complet ne sert qu'à l'export CSV, l'affichage ne reçoit
+    que les PREVIEW_ROWS premières périodes.
+    """
+    schedule, summary = build_schedule_cached(**params)
+    if not schedule:
+        return None, summary, b""
+
+    df = pd.DataFrame({
+        "Période": schedule.period,
+        "Date": pd.to_datetime(schedule.date).strftime("%d/%m/%Y"),
+        "Versement": np.round(schedule.payment, 2),
+        "Intérêt": np.round(schedule.interest, 2),
+        "Principal": np.round(schedule.principal, 2),
+        "Solde restant": np.round(schedule.balance, 2),
+    })
+    return df.iloc[:PREVIEW_ROWS].copy(), summary, df.to_csv(index=False).encode("utf-8-sig")
+
+
+@st.cache_data(show_spinner=False)
+def _solde_fig(balances: tuple) -> dict:
+    """Figure du solde restant, sérialisée en dict et mise en cache par série."""
+    y_preview = np.asarray(balances)
+    x_preview = np.arange(1, y_preview.size + 1)
+    fig = go.Figure()
+    fig.add_trace(
+        go.Scatter(
+            x=x_preview,
+            y=y_preview,
+            mode="lines",
+            name="Solde restant",
+        )
+    )
+    fig.update_layout(
+        margin=dict(l=10, r=10, t=10, b=10),
+        height=320,
+        xaxis_title="Période",
+        yaxis_title="Montant",
+    )
+    return fig.to_dict()
+
+
+@st.fragment
+def cas_pratique_page():
+    st.markdown("## Cas pratique — Moteur d'échéancier de crédit")
+
+    st.markdown(
+        """
+<style>
+.card {
+    background-color: #ffffff;
+    border: 1px solid #e5e7eb;
+    border-radius: 14px;
+    padding: 20px;
+    margin-top: 20px;
+    box-shadow: 0 8px 24px rgba(0,0,0,0.05);
+}
+.small {
+    font-size: 15px;
+    color: #374151;
+    line-height: 1.6;
+}
+</style>
+""",
+        unsafe_allow_html=True,
+    )
+
+    st.markdown(
+        """
+<div class="card">
+  <div class="small">
+    Démonstration interactive d’un moteur de calcul d’échéancier
+    supportant plusieurs modes de remboursement, la sélection
+    de la base de calcul, des paramètres avancés (fréquences, différé, flat, frais)
+    et l’export des résultats.
+  </div>
+</div>
+""",
+        unsafe_allow_html=True,
+    )
+
+    st.write("")
+
+    # un seul rerun (et un seul calcul) par validation du formulaire
+    with st.form("loan"):
+        # ---- Ligne 1 : type de remboursement, montant , durée
+        l1a, l1b, l1c = st.columns(3, gap="large")
+        with l1a:
+            repayment_type = st.selectbox(
+                "Type de calcul de l’échéance",
+                [TYPE_IN_FINE, TYPE_CONSTANT_AMORTIZATION, TYPE_ANNUITY],
+                format_func=lambda x: {
+                    TYPE_IN_FINE: "In fine",
+                    TYPE_CONSTANT_AMORTIZATION: "Amortissement constant",
+                    TYPE_ANNUITY: "Annuité constante",
+                }[x],
+            )
+        with l1b:
+            amount = st.number_input("Montant du prêt", min_value=0.0, value=119_804.0, step=1_000.0)
+        with l1c:
+            period_count = st.number_input("Durée (en mois)", min_value=1, value=130, step=1)
+
+        # ---- Ligne 2 : Fréquence de paiement, Fréquence d’intérêt, taux annuel
+        l2a, l2b, l2c = st.columns(3, gap="large")
+        with l2a:
+            payment_freq = st.selectbox("Fréquence de paiement (en mois)", [1, 2, 3, 6, 12], index=0)
+        with l2b:
+            interest_freq = st.selectbox("Fréquence d’intérêt (mois)", [1, 2, 3, 6, 12], index=0)
+        with l2c:
+            annual_rate = st.number_input("Taux annuel (en %)", min_value=0.0, value=6.5, step=0.1) / 100.0
+
+        # ---- Ligne 3 : mode flat, base de calcul, date de déblocage
+        l3a, l3b, l3c = st.columns(3, gap="large")
+        with l3a:
+            flat = st.toggle("taux nominal", value=False)
+        with l3b:
+            base = st.selectbox(
+                "Base de calcul",
+                [BASE_MENSUELLE_12, BASE_360],
+                format_func=lambda x: "Base 360/30 (mensuel)" if x == BASE_MENSUELLE_12 else "Base 365/30,25 (jours)",
+            )
+        with l3c:
+            disb = st.date_input("Date de déblocage", value=date(2025, 4, 29))
+
+        # ---- Ligne 4 : Première échéance, Périodes de différé, frais
+        l4a, l4b, l4c = st.columns(3, gap="large")
+        with l4a:
+            first = st.date_input("Première échéance", value=date(2025, 5, 29))
+        with l4b:
+            deferred = st.number_input("Périodes de différé", min_value=0, value=0, step=1)
+        with l4c:
+            fee = st.number_input("Frais", min_value=0.0, value=0.0, step=50.0)
+
+        show_taeg = st.toggle("Calculer le TAEG (coût réel du crédit)", value=True)
+        st.form_submit_button("Calculer l'échéancier")
+
+    # Génération échéancier
+    df_preview, summary, csv_bytes = compute_schedule(
+        repayment_type=repayment_type,
+        amount=float(amount),
+        annual_rate=float(annual_rate),
+        period_count=int(period_count),
+        payment_frequency_months=int(payment_freq),
+        interest_frequency_months=int(interest_freq),
+        deferred_periods=int(deferred),
+        flat=bool(flat),
+        fee_amount=float(fee),
+        base=base,
+        disbursement_date=disb,
+        first_installment_date=first,
+    )
+
+    if df_preview is None:
+        st.error("Impossible de générer l'échéancier. Vérifie les paramètres.")
+    else:
+
+        st.write("")
+        k1, k2, k3, k4 = st.columns(4)
+        k1.metric("Total versements", f"{summary.get('total_payment', 0):,.2f}")
+        k2.metric("Total intérêts", f"{summary.get('total_interest', 0):,.2f}")
+        k3.metric("Total principal", f"{summary.get('total_principal', 0):,.2f}")
+
+        if show_taeg:
+            taeg = summary.get("taeg", float("nan"))
+            k4.metric("TAEG", "—" if taeg != taeg else f"{taeg*100:.2f}%")
+        else:
+            if repayment_type == TYPE_ANNUITY:
+                k4.metric("Annuité (paiement)", f"{summary.get('payment_const', 0):,.2f}")
+            else:
+                k4.metric("Mode Flat", "Oui" if flat else "Non")
+
+
+        st.write("")
+        st.markdown("### Échéancier (24 premières périodes)")
+        st.table(df_preview.set_index("Période").style.format(precision=2))
+
+        st.download_button(
+            "Exporter en CSV",
+            data=csv_bytes,
+            file_name="echeancier.csv",
+            mime="text/csv",
+        )
+
+        st.write("")
+        st.markdown("### Solde restant (24 premières périodes)")
+        st.plotly_chart(_solde_fig(tuple(df_preview["Solde restant"].tolist())), width="stretch")
+
+
+cas_pratique_page()
@@ -0,0 +1,204 @@
+import streamlit as st
+
+
+# ============================
+# COMPETENCES
+# ============================
+@st.fragment
+def competences_page():
+    st.markdown("## Compétences")
+
+    st.markdown(
+        """
+<style>
+.skill-card{
+  background: rgba(255,255,255,0.04);
+  border: 1px solid rgba(255,255,255,0.10);
+  border-radius: 16px;
+  padding: 20px 20px;
+  height: 100%;
+}
+
+.skill-header{
+  display: flex;
+  align-items: center;
+  gap: 10px;
+  margin-bottom: 12px;
+}
+
+.skill-title{
+  font-size: 16px;
+  font-weight: 700;
+}
+
+.skill-desc{
+  font-size: 16px;
+  opacity: 2;
+  margin-bottom: 16px;
+}
+
+.skill-tags{
+  display: flex;
+  font-size: 15px;
+  opacity: 4;
+  flex-wrap: wrap;
+  gap: 8px;
+}
+
+.skill-tag{
+  font-size: 12px;
+  padding: 6px 10px;
+  border-radius: 999px;
+  border: 1px solid rgba(255,255,255,0.15);
+  background: rgba(255,255,255,0.05);
+}
+</style>
+""",
+        unsafe_allow_html=True,
+    )
+    st.markdown(
+    """
+<style>
+.skill-tags{
+  display: grid;
+  grid-template-columns: repeat(auto-fill, minmax(140px, 1fr));
+  gap: 12px;
+}
+
+.skill-tag{
+  background: linear-gradient(
+    135deg,
+    rgba(255,255,255,0.08),
+    rgba(255,255,255,0.03)
+  );
+  border: 1px solid rgba(255,255,255,0.15);
+  border-radius: 12px;
+  padding: 10px 12px;
+  font-size: 13px;
+  font-weight: 600;
+  text-align: center;
+  white-space: nowrap;
+
+  box-shadow:
+    inset 0 1px 0 rgba(255,255,255,0.06),
+    0 6px 16px rgba(0,0,0,0.08);
+
+  transition: all 0.2s ease;
+}
+
+.skill-tag:hover{
+  transform: translateY(-2px);
+  background: linear-gradient(
+    135deg,
+    rgba(255,255,255,0.12),
+    rgba(255,255,255,0.05)
+  );
+  box-shadow:
+    inset 0 1px 0 rgba(255,255,255,0.08),
+    0 10px 24px rgba(0,0,0,0.12);
+}
+</style>
+""",
+    unsafe_allow_html=True,
+)
+
+
+    col1, col2, col3 = st.columns(3, gap="large")
+
+
+    # --- TECH ---
+    with col1:
+        st.markdown(
+            """
+<div class="skill-card">
+  <div class="skill-header">
+    <svg width="18" height="18" viewBox="0 0 24 24" fill="none">
+      <path d="M4 6h16M4 12h16M4 18h16" stroke="currentColor" stroke-width="2"/>
+    </svg>
+    <div class="skill-title">Compétences techniques</div>
+  </div>
+
+  <div class="skill-desc">
+    Conception et développement d’applications backend & frontend sécurisées,
+    orientées performance et logique métier bancaire.
+  </div>
+
+  <div class="skill-tags">
+    <div class="skill-tag">Angular</div>
+    <div class="skill-tag">FastAPI</div>
+    <div class="skill-tag">Python</div>
+    <div class="skill-tag">Spring Boot</div>
+    <div class="skill-tag">PostgreSQL</div>
+    <div class="skill-tag">MySQL</div>
+    <div class="skill-tag">Keycloak</div>
+    <div class="skill-tag">OIDC / RBAC</div>
+  </div>
+</div>
+""",
+            unsafe_allow_html=True,
+        )
+
+    # --- FINANCE ---
+    with col2:
+        st.markdown(
+            """
+<div class="skill-card">
+  <div class="skill-header">
+    <svg width="18" height="18" viewBox="0 0 24 24" fill="none">
+      <path d="M3 12l3 3 6-6 4 4 5-5" stroke="currentColor" stroke-width="2"/>
+    </svg>
+    <div class="skill-title">Finance & Banque</div>
+  </div>
+
+  <div class="skill-desc">
+    Expertise fonctionnelle sur les processus bancaires, le crédit,
+    l’analyse du risque et le pilotage par indicateurs.
+  </div>
+
+  <div class="skill-tags">
+    <div class="skill-tag">Crédit (LTV, DTI)</div>
+    <div class="skill-tag">Échéanciers</div>
+    <div class="skill-tag">Garanties & Collatéraux</div>
+    <div class="skill-tag">KPIs & Dashboards</div>
+    <div class="skill-tag">Reporting</div>
+    <div class="skill-tag">Process bancaires</div>
+    <div class="skill-tag">Suivi post-attribution</div>
+  </div>
+</div>
+""",
+            unsafe_allow_html=True,
+        )
+    # --- DEVOPS ---
+    with col3:
+        st.markdown(
+            """
+    <div class="skill-card">
+      <div class="skill-header">
+        <svg width="18" height="18" viewBox="0 0 24 24" fill="none">
+          <path d="M4 12a8 8 0 0116 0M8 12a4 4 0 018 0" stroke="currentColor" stroke-width="2"/>
+          <circle cx="12" cy="16" r="2" stroke="currentColor" stroke-width="2"/>
+        </svg>
+        <div class="skill-title">DevOps & Observabilité</div>
+      </div>
+
+      <div class="skill-desc">
+        Automatisation du cycle de livraison, qualité logicielle
+        et supervision des applications conteneurisées.
+      </div>
+
+      <div class="skill-tags">
+        <div class="skill-tag">Docker</div>
+        <div class="skill-tag">Jenkins (CI/CD)</div>
+        <div class="skill-tag">SonarQube</div>
+        <div class="skill-tag">Prometheus</div>
+        <div class="skill-tag">Grafana</div>
+        <div class="skill-tag">Monitoring & Alerting</div>
+        <div class="skill-tag">Microservices</div>
+      </div>
+    </div>
+    """,
+            unsafe_allow_html=True,
+        )
+
+
+competences_page()
@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import streamlit as st
+
+
+CSS_PATH = Path(__file__).with_name("contact_styles.css")
+
+
+@st.cache_resource
+def _load_css() -> str:
+    return CSS_PATH.read_text(encoding="utf-8")
+
+
+# ============================
+# CONTACT
+# ============================
+@st.fragment
+def contact_page():
+    st.markdown("## Contact")
+
+    # styles et contenu séparés : le CSS est lu une seule fois
+    st.markdown(f"<style>{_load_css()}</style>", unsafe_allow_html=True)
+
+    st.markdown(
+        """
+<div class="contact-card">
+
+  <div class="contact-row">
+    <div class="contact-icon">
+      <svg width="18" height="18" viewBox="0 0 24 24" fill="none">
+        <path d="M12 2C8.13 2 5 5.13 5 9c0 5.25 7 13 7 13s7-7.75 7-13c0-3.87-3.13-7-7-7z" stroke="currentColor" stroke-width="2"/>
+        <circle cx="12" cy="9" r="2.5" stroke="currentColor" stroke-width="2"/>
+      </svg>
+    </div>
+    <div>
+      <div class="contact-label">Localisation</div>
+      <div class="contact-value">Tunis, Tunisie</div>
+    </div>
+  </div>
+
+  <div class="contact-row">
+    <div class="contact-icon">
+      <svg width="18" height="18" viewBox="0 0 24 24" fill="none">
+        <path d="M4 4h16v16H4z" stroke="currentColor" stroke-width="2"/>
+        <path d="M4 4l8 8 8-8" stroke="currentColor" stroke-width="2"/>
+      </svg>
+    </div>
+    <div>
+      <div class="contact-label">Email</div>
+      <div class="contact-value">chohdi.kema@gmail.com</div>
+    </div>
+  </div>
+
+  <div class="contact-row">
+    <div class="contact-icon">
+      <svg width="18" height="18" viewBox="0 0 24 24" fill="none">
+        <path d="M22 16.92v3a2 2 0 0 1-2.18 2A19.8 19.8 0 0 1 3 5.18 2 2 0 0 1 5 3h3a2 2 0 0 1 2 1.72c.12.9.32 1.76.6 2.58a2 2 0 0 1-.45 2.11L9 10a16 16 0 0 0 5 5l.59-.15a2 2 0 0 1 2.11.45c.82.28 1.68.48 2.58.6A2 2 0 0 1 22 16.92z"
+              stroke="currentColor" stroke-width="2"/>
+      </svg>
+    </div>
+    <div>
+      <div class="contact-label">Téléphone</div>
+      <div class="contact-value">+216 50 513 004</div>
+    </div>
+  </div>
+
+</div>
+""",
+        unsafe_allow_html=True,
+    )
+
+
+contact_page()
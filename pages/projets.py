@@ -0,0 +1,170 @@
+import streamlit as st
+
+from helpers import (
+    CCI_DIR,
+    CREDITTIC_DIR,
+    CREDITTIC_LINK,
+    SM_DIR,
+    collect_images,
+    first_existing,
+    list_devops_images,
+    render_gallery,
+)
+
+
+# ============================
+# PROJETS
+# ============================
+@st.fragment
+def projets_page():
+    st.markdown("## Projets")
+
+    tabs = st.tabs(["CréditTic", "Salle de Marché", "Centrale des Chèques Impayés", "DevOps CI/CD & Monitoring"])
+
+    # ---- CréditTic ----
+    with tabs[0]:
+        st.markdown("""
+<div class="card">
+
+<h3>CréditTic — Digitalisation du cycle complet de crédit</h3>
+
+<ul>
+  <li>Architecture n-tiers : <b>Spring Boot</b> • <b>Angular</b> • <b>PostgreSQL</b></li>
+  <li>Authentification : <b>Keycloak</b> (SSO / MFA)</li>
+  <li>Modules : simulation de prêt (<b>LTV</b>, <b>DTI</b>, annuités), gestion des garanties, génération de documents, dashboards</li>
+
+  <li><b>IA intégrée (LLM)</b> : utilisation de <b>Llama 3 8B</b> via <b>LM Studio</b> pour assister les processus de crédit :</li>
+  <ul>
+    <li>Génération d’une <b>offre de crédit</b> (résumé + proposition) à partir des données client</li>
+    <li><b>Optimisation / recommandation</b> de garanties selon le profil et les règles métier</li>
+    <li><b>Remplissage automatique</b> de champs (pré-saisie) à partir d’un paragraphe descriptif fourni par l’agent</li>
+    <li>Support à la <b>simulation</b> et explication des résultats (LTV/DTI/échéancier) en langage naturel</li>
+  </ul>
+
+  <li>Objectif : réduire les délais de traitement, améliorer la traçabilité et l’expérience client</li>
+</ul>
+
+</div>
+""", unsafe_allow_html=True)
+
+
+
+
+        demo_video = first_existing(CREDITTIC_DIR / "creditTic_demo.mp4")
+        if demo_video:
+            st.markdown("### Démonstration")
+            st.video(str(demo_video))
+        elif CREDITTIC_LINK.strip():
+            st.markdown("### Démonstration")
+            st.video(CREDITTIC_LINK.strip())
+        else:
+            st.caption("Ajoute static/creditTic/creditTic_demo.mp4 (optionnel) ou renseigne un lien externe dans CREDITTIC_LINK.")
+
+        arch = first_existing(CREDITTIC_DIR / "creditTic_architecture.png")
+        if arch:
+            st.write("")
+            st.markdown("### Architecture")
+            st.markdown("""CréditTic est une plateforme de digitalisation du crédit conçue pour automatiser et sécuriser l’ensemble du cycle de traitement des demandes. Elle combine une architecture web n-tiers moderne, des services bancaires robustes et des capacités d’intelligence artificielle afin d’améliorer la simulation des prêts, l’optimisation des garanties et la génération des offres de crédit, tout en respectant les exigences de sécurité et de conformité du secteur bancaire.""")
+            st.image(str(arch), width="stretch")
+
+        st.write("")
+        st.markdown("### Captures d'écran")
+        credit_imgs = collect_images(CREDITTIC_DIR.as_posix(), prefixes=("creditTic_",))
+        render_gallery(credit_imgs, per_row=3, limit=18)
+
+    # ---- CCI ----
+    with tabs[2]:
+        st.markdown("""
+<div class="card">
+
+<h3>Centrale des Chèques Impayés — BNA</h3>
+
+<ul>
+<li>Modélisation des processus de gestion internes</li>
+<li>Suivi et gestion opérationnelle des chèques impayés</li>
+<li>KPIs et dashboards de production</li>
+<li>Génération d’états PDF</li>
+</ul>
+
+</div>
+""", unsafe_allow_html=True)
+
+        cci_demo = first_existing(CCI_DIR/ "cci_demo.mp4", CCI_DIR / "cci_demo.mov")
+        if cci_demo:
+            st.markdown("### Démonstration")
+            st.video(str(cci_demo))
+        else:
+            st.caption("Ajoute static/salle_marche/sm_demo.mp4 (optionnel).")
+        st.write("")
+        st.markdown("### Captures d'écran")
+        cci_imgs = collect_images(CCI_DIR.as_posix(), prefixes=("cci_", "CentraledesChequesImpayes", "CentraledesChèquesImpayés"))
+        render_gallery(cci_imgs, per_row=3, limit=18)
+
+    # ---- Salle de Marché ----
+    with tabs[1]:
+        st.markdown("""
+<div class="card">
+
+<h3>Simulateur de Salle de Marché</h3>
+
+<ul>
+<li>Plateforme interactive de simulation</li>
+<li>Analyse technique et fondamentale</li>
+<li>Visualisation et indicateurs de marché</li>
+</ul>
+
+</div>
+""", unsafe_allow_html=True)
+
+
+        sm_demo = first_existing(SM_DIR / "sm_demo.mp4", SM_DIR / "sm_demo.mov")
+        if sm_demo:
+            st.markdown("### Démonstration")
+            st.video(str(sm_demo))
+        else:
+            st.caption("Ajoute static/salle_marche/sm_demo.mp4 (optionnel).")
+
+        st.write("")
+        st.markdown("### Captures d'écran")
+        sm_imgs = collect_images(SM_DIR.as_posix(), prefixes=("sm_",))
+        render_gallery(sm_imgs, per_row=3, limit=24)
+    # ---- DevOps ----
+    with tabs[3]:
+        st.markdown(
+            """
+    <div class="card">
+
+<h3>Mise en place d’une Chaîne DevOps CI/CD et de Supervision pour une Architecture Microservices</h3>
+
+<ul>
+  <li><b>Objectif :</b> industrialiser le cycle de livraison (build, tests, déploiement) et assurer une supervision complète (métriques, alerting, dashboards).</li>
+  <li><b>Conteneurisation :</b> packaging et exécution des services <b>backend</b> et <b>frontend</b> via <b>Docker</b> (gestion des dépendances et environnements reproductibles).</li>
+  <li><b>CI/CD :</b> pipeline automatisé avec <b>Jenkins</b> (tests, build, déploiement) afin de fiabiliser et accélérer la mise en production.</li>
+  <li><b>Qualité & sécurité :</b> intégration de <b>SonarQube</b> pour les contrôles de qualité, l’analyse statique et les <b>quality gates</b>.</li>
+  <li><b>Observabilité :</b> collecte de métriques avec <b>Prometheus</b> et visualisation via <b>Grafana</b> (dashboards de disponibilité, CPU/RAM, latence, erreurs, santé des services).</li>
+  <li><b>Base de données :</b> <b>MySQL</b> conteneurisé pour simplifier la connectivité backend et la gestion des données.</li>
+</ul>
+
+</div>
+    """,
+            unsafe_allow_html=True,
+        )
+
+        st.markdown("### Dashboards & supervision")
+        st.write(
+            "Mise en place de tableaux de bord Grafana pour suivre en temps réel la disponibilité, "
+            "la consommation CPU/RAM, les erreurs et la performance des services, avec collecte des métriques via Prometheus."
+        )
+
+        st.write("")
+        st.markdown("### Captures d'écran")
+
+        devops_imgs = list_devops_images()
+
+        if devops_imgs:
+            render_gallery(devops_imgs, per_row=3, limit=24)
+        else:
+            st.caption("Aucune image trouvée. Vérifie static/devops et les noms devops_*.jfif/.jpg/.png")
+
+
+projets_page()